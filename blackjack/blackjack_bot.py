@@ -1,5 +1,6 @@
 from highrise import BaseBot, User
 from random import randrange
+from rate_limiter import CommandLimiter
 
 """
 Usage:
@@ -34,6 +35,7 @@ class BlackJackBot(BaseBot):
 
     identifier: str = "/b "  # Command prefix for the bot
     game: 'BlackJackGame' = None
+    limiter: CommandLimiter = CommandLimiter(rate=1, burst=5, max_in_flight=4)  # Throttles command spam
     COMMANDS: list[str] = [
         "help",             # list all commands
         "create",           # create a blackjack game
@@ -73,7 +75,9 @@ class BlackJackBot(BaseBot):
         """On a received room-wide chat."""
         message = message.lower()
         if (message.startswith(self.identifier)):
-            await self.handle_command(user, message.removeprefix(self.identifier))
+            message = message.removeprefix(self.identifier)
+            await self.limiter.run(user.id, lambda: self.handle_command(user, message),
+                                   lambda reply: self.whisper_to_user(user, reply))
 
     async def handle_command(self, user: User, message: str) -> None:
         """Handler for all bot commands"""
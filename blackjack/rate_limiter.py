@@ -0,0 +1,119 @@
+# This module is duplicated on purpose: the Weather, Statistics, Blackjack and Echo bots each keep
+# an identical copy next to the bot file so every example can run from its own directory.
+# Any change made here must be copied to every other rate_limiter.py so the copies stay in sync.
+
+from asyncio import Semaphore
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from time import monotonic
+
+"""
+Usage:
+Create one CommandLimiter per bot and run every command handler through it:
+
+limiter = CommandLimiter(rate=0.5, burst=3, max_in_flight=4)
+
+await limiter.run(user.id, lambda: handle_command(user, message), lambda reply: whisper(user, reply))
+"""
+
+
+class TokenBucket:
+    """
+    A single user's token bucket.
+
+    Tokens are refilled lazily whenever the bucket is checked, so an idle bucket costs nothing
+    until that user sends another command.
+    """
+
+    __slots__ = ("tokens", "last_refill", "warned")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens: float = tokens
+        self.last_refill: float = now
+        self.warned: bool = False  # Whether the user was already told their commands are rejected
+
+
+class CommandLimiter:
+    """
+    Per-user command rate limiting with a global cap on in-flight command handlers.
+
+    Every user gets a token bucket keyed by their user id, holding up to `burst` tokens and
+    refilling at `rate` tokens per second. Each command costs one token. Buckets are kept in
+    least-recently-used order, and any bucket that has been idle long enough to refill completely
+    is evicted, since it is indistinguishable from a brand new one. This keeps memory proportional
+    to the number of recently active users.
+    """
+
+    def __init__(self, rate: float = 0.5, burst: int = 3, max_in_flight: int = 4):
+        self.rate: float = rate
+        self.burst: int = burst
+        self.idle_timeout: float = burst / rate  # Time for an empty bucket to refill completely
+        self.buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self.in_flight: Semaphore = Semaphore(max_in_flight)
+
+    async def run(self, user_id: str, handler: Callable[[], Awaitable[None]],
+                  reject: Callable[[str], Awaitable[None]]) -> None:
+        """Runs a command handler, or rejects it if the bot is busy or the user is over their limit."""
+        # Check the bot's load first, so a busy bot doesn't use up the user's own quota
+        if self.is_busy():
+            # Busy rejections share the warn-once streak, so spamming a busy bot only earns one whisper
+            if self.should_warn(user_id):
+                await reject("The bot is busy, please try again in a moment")
+            return
+
+        if not self.allow(user_id):
+            # Only warn once, further commands are dropped until the user slows down
+            if self.should_warn(user_id):
+                await reject("You are sending commands too fast, please slow down")
+            return
+
+        async with self.in_flight:
+            await handler()
+
+    def allow(self, user_id: str) -> bool:
+        """Consumes a token for the user, returns False if they are over their limit."""
+        bucket = self.get_bucket(user_id)
+
+        if bucket.tokens < 1:
+            return False
+
+        bucket.tokens -= 1
+        bucket.warned = False
+        return True
+
+    def get_bucket(self, user_id: str) -> TokenBucket:
+        """Returns the user's token bucket refilled up to now, creating it if needed."""
+        now = monotonic()
+        self.evict_idle(now)
+
+        bucket = self.buckets.get(user_id)
+        if bucket is None:
+            bucket = self.buckets[user_id] = TokenBucket(self.burst, now)
+        else:
+            # Refill based on the time elapsed since the last check
+            bucket.tokens = min(self.burst, bucket.tokens +
+                                (now - bucket.last_refill) * self.rate)
+            bucket.last_refill = now
+            self.buckets.move_to_end(user_id)
+        return bucket
+
+    def should_warn(self, user_id: str) -> bool:
+        """Determines if a rejected user should be told about it, only once per rejected streak."""
+        bucket = self.get_bucket(user_id)
+        if bucket.warned:
+            return False
+        bucket.warned = True
+        return True
+
+    def is_busy(self) -> bool:
+        """Determines if the maximum number of command handlers are already running"""
+        return self.in_flight.locked()
+
+    def evict_idle(self, now: float) -> None:
+        """Removes buckets that have been idle long enough to be full again."""
+        # Buckets are in least-recently-used order, so we can stop at the first active one
+        while self.buckets:
+            user_id, bucket = next(iter(self.buckets.items()))
+            if now - bucket.last_refill < self.idle_timeout:
+                break
+            del self.buckets[user_id]
@@ -1,7 +1,36 @@
 from highrise import BaseBot, CurrencyItem, Item, Position, Reaction, SessionMetadata, User
+from event_aggregator import WindowedAggregator
+from rate_limiter import CommandLimiter
+
+"""
+Usage:
+Besides echoing every room event to the console, the Echo Bot keeps live figures of tips, reactions
+and emotes over the last 5 minutes. Use any of the following commands in the chat of the room your
+bot is currently in to see them:
+
+/e tips
+/e reactions
+/e emotes
+
+Example:
+/e tips
+
+The Echo Bot will show the top tippers, along with the amount of gold each of them is guaranteed to
+have tipped during the window. Only gold tips are counted, item and other currency tips are ignored.
+Figures are lower bounds, so during very busy events they may undercount.
+"""
 
 
 class Bot(BaseBot):
+    identifier: str = "/e "  # Command prefix for the bot
+    limiter: CommandLimiter = CommandLimiter(rate=0.2, burst=3, max_in_flight=2)  # Throttles room chat spam
+    # Live figures over the last 5 minutes, without storing every raw event
+    aggregators: dict[str, WindowedAggregator] = {
+        "tips": WindowedAggregator(),       # gold tipped, keyed by sender
+        "reactions": WindowedAggregator(),  # reactions received, keyed by receiver
+        "emotes": WindowedAggregator()      # emotes performed, keyed by user
+    }
+
     async def on_user_join(self, user: User) -> None:
         """On a user joining the room."""
         print(f"[JOIN   ] {user.username}")
@@ -20,6 +49,23 @@ class Bot(BaseBot):
     async def on_chat(self, user: User, message: str) -> None:
         print(f"[CHAT   ] {user.username}: {message}")
 
+        message = message.lower().strip()
+        if message.startswith(self.identifier):
+            message = message.removeprefix(self.identifier).strip()
+            await self.limiter.run(user.id, lambda: self.handle_command(user, message),
+                                   lambda reply: self.highrise.send_whisper(user.id, reply))
+
+    async def handle_command(self, user: User, message: str) -> None:
+        """Handler for all bot commands"""
+        if message in self.aggregators:
+            aggregator = self.aggregators[message]
+            lines = [f"Top {message} in the last 5 minutes (total {aggregator.get_total()}):"]
+            for key, count in aggregator.get_top():
+                lines.append(f"{key}: at least {count}")
+            await self.highrise.chat("\n".join(lines))
+        else:
+            await self.highrise.send_whisper(user.id, f"Not a valid command. Use {self.identifier}tips, reactions or emotes")
+
     async def on_whisper(self, user: User, message: str) -> None:
         """On a whisper."""
         print(f"[WHISPER] {user.username} {message}")
@@ -27,10 +73,12 @@ class Bot(BaseBot):
     async def on_emote(self, user: User, emote_id: str, receiver: User | None) -> None:
         """On a received emote."""
         print(f"[EMOTE  ] {user.username} {emote_id} {receiver}")
+        self.aggregators["emotes"].add(user.username)
 
     async def on_reaction(self, user: User, reaction: Reaction, receiver: User) -> None:
         """Called when someone reacts in the room."""
         print(f"[REACTION ] {user.username} {reaction} {receiver.username}")
+        self.aggregators["reactions"].add(receiver.username)
 
     async def on_tip(
         self, sender: User, receiver: User, tip: CurrencyItem | Item
@@ -38,6 +86,10 @@ class Bot(BaseBot):
         """On a tip received in the room."""
         print(f"[TIP ] {sender.username} {receiver.username} {tip.type} {tip.amount}")
 
+        # Only gold tips are counted, amounts of different currencies or items can't be added up
+        if isinstance(tip, CurrencyItem) and tip.type == "gold":
+            self.aggregators["tips"].add(sender.username, tip.amount)
+
     async def on_user_move(self, user: User, pos: Position) -> None:
         """On a user moving in the room."""
         print(f"[MOVE ] {user.username} {pos.x} {pos.y} {pos.z}")
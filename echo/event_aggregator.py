@@ -0,0 +1,118 @@
+from time import monotonic
+
+"""
+Streaming aggregators for room events such as tips, reactions and emotes.
+
+Rather than storing every raw event, each aggregator splits a sliding time window into a fixed
+number of slots. Every slot keeps a running total and a Space-Saving sketch of the heaviest keys
+seen during that slot. Reported weights are guaranteed lower bounds, never inflated estimates.
+Memory is bounded by the number of slots and the sketch capacity, no matter how many events
+arrive, and queries only ever touch those bounded structures.
+"""
+
+
+class SpaceSaving:
+    """
+    A Space-Saving sketch that tracks the approximate heaviest keys of a stream.
+
+    At most `capacity` keys are counted. When a new key arrives and the sketch is full, the key
+    with the smallest count is replaced and the new key inherits that count as its error. A key's
+    count may therefore be overestimated, but never by more than its error, so `count - error` is
+    a guaranteed lower bound on how much weight the key really received.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity: int = capacity
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}  # Overestimation inherited from an evicted key
+
+    def add(self, key: str, weight: int = 1) -> None:
+        """Adds a weighted occurrence of a key to the sketch."""
+        if key in self.counts:
+            self.counts[key] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = weight
+            self.errors[key] = 0
+        else:
+            # Replace the smallest counter, the new key inherits its count as error
+            smallest = min(self.counts, key=self.counts.get)
+            inherited = self.counts.pop(smallest)
+            del self.errors[smallest]
+            self.counts[key] = inherited + weight
+            self.errors[key] = inherited
+
+    def get_lower_bound(self, key: str) -> int:
+        """Returns the weight the key is guaranteed to have received."""
+        return self.counts[key] - self.errors[key]
+
+
+class WindowSlot:
+    """A single slot of a sliding window, covering a fixed span of time."""
+
+    def __init__(self, start: float, capacity: int):
+        self.start: float = start
+        self.total: int = 0
+        self.top: SpaceSaving = SpaceSaving(capacity)
+
+
+class WindowedAggregator:
+    """
+    Aggregates weighted events over a sliding time window.
+
+    The window of `window` seconds is split into `slots` slots. Expired slots are recycled as time
+    moves forward, and a running total over the live slots is kept so the total can be read
+    without summing. Top keys are found by summing the lower bounds from the sketches of the live
+    slots, so a reported weight is never more than the key actually received in the window.
+    """
+
+    def __init__(self, window: float = 300, slots: int = 10, capacity: int = 20):
+        self.slot_length: float = window / slots
+        self.capacity: int = capacity
+        self.slots: list[WindowSlot] = [WindowSlot(0, capacity) for _ in range(slots)]
+        self.total: int = 0  # Running total over all live slots
+
+    def add(self, key: str, weight: int = 1) -> None:
+        """Records a weighted event for a key."""
+        slot = self.current_slot(monotonic())
+        slot.total += weight
+        slot.top.add(key, weight)
+        self.total += weight
+
+    def get_total(self) -> int:
+        """Returns the total weight of all events in the window."""
+        self.current_slot(monotonic())
+        return self.total
+
+    def get_top(self, k: int = 5) -> list[tuple[str, int]]:
+        """Returns the k heaviest keys in the window, with the weight each is guaranteed to have."""
+        self.current_slot(monotonic())
+
+        # Expired slots have already been cleared, so every remaining count is in the window
+        merged: dict[str, int] = {}
+        for slot in self.slots:
+            for key in slot.top.counts:
+                merged[key] = merged.get(key, 0) + slot.top.get_lower_bound(key)
+
+        # Keys without any guaranteed weight are only noise left over from evictions
+        top = [(key, weight) for key, weight in merged.items() if weight > 0]
+        return sorted(top, key=lambda item: item[1], reverse=True)[:k]
+
+    def current_slot(self, now: float) -> WindowSlot:
+        """Returns the slot for the current time, clearing any expired slots first."""
+        self.expire(now)
+
+        tick = int(now // self.slot_length)
+        slot = self.slots[tick % len(self.slots)]
+        # A slot from a previous lap of the window is always expired, so it is already empty
+        slot.start = tick * self.slot_length
+        return slot
+
+    def expire(self, now: float) -> None:
+        """Clears slots that have fallen out of the window and drops them from the running total."""
+        window = self.slot_length * len(self.slots)
+        for slot in self.slots:
+            # Check the sketch too, a slot can hold keys whose events all had zero weight
+            if (slot.total or slot.top.counts) and now - slot.start >= window:
+                self.total -= slot.total
+                slot.total = 0
+                slot.top = SpaceSaving(self.capacity)
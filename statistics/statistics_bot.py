@@ -2,6 +2,7 @@ from json import load, dump
 from time import time
 from math import sqrt
 from highrise import BaseBot, User, Position, AnchorPosition
+from rate_limiter import CommandLimiter
 
 """
 Note:
@@ -32,6 +33,7 @@ class StatisticsBot(BaseBot):
 
     identifier: str = "/s "  # Command prefix for the bot
     lobby: dict[str, dict] = {} # A dictionary to store user activity data temporarily
+    limiter: CommandLimiter = CommandLimiter(rate=0.2, burst=3, max_in_flight=2)  # Throttles command spam
 
     async def on_chat(self, user: User, message: str) -> None:
         """On a received room-wide chat."""
@@ -44,7 +46,9 @@ class StatisticsBot(BaseBot):
 
         # Handle commands
         if message.startswith(self.identifier):
-            await self.handle_command(user, message.removeprefix(self.identifier))
+            message = message.removeprefix(self.identifier)
+            await self.limiter.run(user.id, lambda: self.handle_command(user, message),
+                                   lambda reply: self.highrise.send_whisper(user.id, reply))
 
     async def on_user_join(self, user: User) -> None:
         """On a user joining the room."""
@@ -1,5 +1,6 @@
 import httpx
 from highrise import BaseBot, User
+from rate_limiter import CommandLimiter
 
 
 """
@@ -32,13 +33,16 @@ class WeatherBot(BaseBot):
 
     identifier: str = "/w "  # Command prefix for the bot
     APIKEY: str = "<YOUR-API-KEY>" # API key for weatherapi.com 
+    limiter: CommandLimiter = CommandLimiter(rate=0.1, burst=2, max_in_flight=3)  # Throttles API calls
 
     async def on_chat(self, user: User, message: str) -> None:
         """On a received room-wide chat."""
 
         # Handle commands
         if message.startswith(self.identifier):
-            await self.handle_command(message.removeprefix(self.identifier))
+            message = message.removeprefix(self.identifier)
+            await self.limiter.run(user.id, lambda: self.handle_command(message),
+                                   lambda reply: self.highrise.send_whisper(user.id, reply))
 
     async def handle_command(self, message: str) -> None:
         """Handler for bot commands"""